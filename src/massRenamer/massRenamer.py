@@ -44,12 +44,16 @@ from exiftool import ExifTool
 from collections import OrderedDict, Counter
 from datetime import datetime, timedelta
 from exiftool import ExifToolHelper
-from json import dump, load
+from exiftool.exceptions import ExifToolOutputEmptyError
+from multiprocessing.pool import ThreadPool
 from natsort import natsorted
+from orjson import dumps, loads
+from os import cpu_count, remove, scandir
+from os.path import join, isfile, splitext
 from pathlib import Path
-from re import compile
+from re import compile, ASCII
 from time import time
-from typing import OrderedDict, Dict, Tuple, List, TypedDict, Match
+from typing import OrderedDict, Dict, FrozenSet, Set, Tuple, List, TypedDict, Match
 
 import natsort
 from ..support.support import lvl, debugPrint
@@ -81,11 +85,20 @@ etJSON: str = "etJSON.json"
 # define this to search for "0000:00:00 00:00:00", an empty date and time
 emptyDate: str = "0000:00:00 00:00:00"
 
+# When fixing dateless files interactively, save the dates picked so far every this many
+# files, to checkpointFileName
+autoSaveEvery: int = 25
+# Filename for the dates picked interactively that haven't been applied yet
+checkpointFileName: str = "data_file_dateless_picks.json"
+# Folders with fewer files than this are processed by a single ExifTool instance, instead
+# of one per CPU, as starting the instances would take longer than the work itself
+minFilesForParallelExifTool: int = 200
+
 # The List of tags to extract with exiftool
 # HACK: sometimes, the filemodifydate tag can help, but it can also be quite harmful, so
 # by default I won't add it to the list of tags
 tagsToExtract: List[str] = ["-UserComment", "-CreateDate", "-DateTimeOriginal",
-                            "-MediaCreareDate", "-Make", "-Model", "-Software", "-filemodifydate"]
+                            "-MediaCreateDate", "-Make", "-Model", "-Software", "-filemodifydate"]
 
 # In images, we will check these tags (and in this order) for a date of creation
 photoTagsToCheck: List[str] = ["EXIF:CreateDate",
@@ -102,27 +115,44 @@ videoTagsToCheck: List[str] = [
 # To check for time offsets: +/-HH:MM
 offsetRegEx = compile(r'[\+\-][0-9]{2}\:[0-9]{2}')
 
-# Searches for "YYYY:MM:DD HH:MM:SS" with an optional "[+/-]XX:XX"
+# Searches for "YYYY:MM:DD HH:MM:SS" with an optional "[+/-]XX:XX". ASCII, as ExifTool
+# dates are plain digits and it saves the unicode lookups on every \d
 dateTimeRegEx = compile(
-    r'(\d{4}\:\d{2}\:\d{2}\s\d{2}\:\d{2}\:\d{2}([\+\-]\d{2}\:\d{2})?)')
+    r'\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}(?:[\+\-]\d{2}:\d{2})?', ASCII)
 
-# List of known video extensions. Add them in lowercase
-videoExtensions: List[str] = [".mov", ".mp4", ".m4v"]
-# List of known photo extensions. Add them in lowercase
-photoExtensions: List[str] = [".heic", ".jpg",
-                              ".jpeg", ".png", ".gif", ".tif", ".tiff"]
-# List of known "don't process" files
-dontProcessExtensions: List[str] = [".aae", ".ds_store"]
+# Sets of extensions. They are only used to check if a file's extension is in them, so
+# frozensets make those checks O(1)
+# Known video extensions. Add them in lowercase
+videoExtensions: FrozenSet[str] = frozenset({".mov", ".mp4", ".m4v"})
+# Known photo extensions. Add them in lowercase
+photoExtensions: FrozenSet[str] = frozenset({".heic", ".jpg",
+                                             ".jpeg", ".png", ".gif", ".tif", ".tiff"})
+# All the extensions of the files we rename
+mediaExtensions: FrozenSet[str] = photoExtensions | videoExtensions
+# Known "don't process" files
+dontProcessExtensions: FrozenSet[str] = frozenset({".aae", ".ds_store"})
 
 
 # Misc stuff, helpers, etc
 ####
 
 
+def writeJSON(jsonData: OrderedDict[str, metadataDict]) -> None:
+    """
+    Writes the metadata of the files to the JSON file (jsonFileName), serialised with orjson
+    in a single write
+
+    Args:
+        jsonData: an OrderedDict with the metadataDict of each file
+    """
+    with open(jsonFileName, "wb") as writeFile:
+        writeFile.write(dumps(jsonData))
+
+
 def getListOfFiles(path: Path) -> List[Path]:
     """
     Returns a list of files in a folder, excluding those whose extension is listed in the
-    dontProcessExtensions list above
+    dontProcessExtensions set above
 
     Args:
         path: a Path to the folder
@@ -133,7 +163,19 @@ def getListOfFiles(path: Path) -> List[Path]:
     if not path.is_dir():
         debugPrint(lvl.ERROR, f"'{path}' is not a folder!")
         exit()
-    return [file for file in path.rglob("*") if file.is_file() and file.suffix not in dontProcessExtensions]
+    # Walk the folder with os.scandir, which gets the type of each entry while listing the
+    # folder, instead of a stat call per file like rglob + is_file. Use a stack of folders
+    # to visit, instead of recursion
+    files: List[Path] = []
+    foldersToVisit: List[str] = [str(path)]
+    while foldersToVisit:
+        with scandir(foldersToVisit.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    foldersToVisit.append(entry.path)
+                elif entry.is_file() and splitext(entry.name)[1] not in dontProcessExtensions:
+                    files.append(Path(entry.path))
+    return files
 
 
 def orderDictByDate(jsonDict: OrderedDict[str, metadataDict]) -> OrderedDict[str, metadataDict]:
@@ -178,7 +220,7 @@ def stripOffset(date: str) -> Tuple[str, str]:
     offset: str = ""
     if date and m:
         # Time includes offset, so remove offset from date
-        strippedDate = offsetRegEx.split(date)[0]
+        strippedDate = date[:m.start()]
         offset = m[0]
         # debugPrint(
         # lvl.DEBUG, f"Stripped offset from date! {date} + {offset}")
@@ -239,7 +281,7 @@ def findCreationTime(file: Path, ExifToolData: Dict[str, str], tagsToCheck: List
     return date_, isDatelessFlag
 
 
-def inferDateFromFile(jsonData: OrderedDict[str, metadataDict], jsonKey: str, fileList: List[Path]) -> Tuple[str, str]:
+def inferDateFromFile(jsonData: OrderedDict[str, metadataDict], jsonKey: str, fileList: List[Path], fileIndex: Dict[str, int] | None = None) -> Tuple[str, str]:
     """
     Infers the date of creation of a file based on previous files.
 
@@ -251,21 +293,26 @@ def inferDateFromFile(jsonData: OrderedDict[str, metadataDict], jsonKey: str, fi
         jsonData: and OrderedDict with the JSON data containing the creation dates of the files in the current folder
         jsonKey: the key for the jsonData ordered Dict (a file path, as a string) of the file to infer.
         fileList: a naturally ordered list of files (so we can check the "previous files")
+        fileIndex: the position of each file of fileList (as a string) in it. When inferring
+            many files, build it once and pass it, instead of searching fileList every time
 
     Returns:
         The inferred date of creation for the file.
     """
     # We will check "previous" files until we find one with a time
-    # Convert the list of Paths to list of strings, to locate the key, extract its order
-    # in the list, and loop in reverse until a key with date is found
-    fileListStr = [str(file) for file in fileList]
+    # Locate the key in the list, extract its order in the list, and loop in reverse until a
+    # key with date is found
+    if fileIndex is not None:
+        keyIndex: int = fileIndex[jsonKey]
+    else:
+        keyIndex = [str(file) for file in fileList].index(jsonKey)
     foundADate: bool = False
     i: int = 1
     debugPrint(lvl.INFO, f"Inferring date for {Path(jsonKey).name}")
     previousKey: str = ""
     newTime: datetime
     while foundADate == False:
-        previousKey = fileListStr[fileListStr.index(jsonKey) - i]
+        previousKey = str(fileList[keyIndex - i])
         if jsonData[previousKey]["dateless"]:
             debugPrint(
                 lvl.WARNING, f"{Path(previousKey).name} doens't have a date")
@@ -283,60 +330,73 @@ def inferDateFromFile(jsonData: OrderedDict[str, metadataDict], jsonKey: str, fi
     return jsonData[previousKey]['date'], newTime.strftime("%H:%M:%S")
 
 
-def inferDateInteractive(jsonData: OrderedDict[str, metadataDict], jsonKey: str, fileList: List[Path]) -> Tuple[str, str]:
+def inferDateInteractive(jsonData: OrderedDict[str, metadataDict], jsonKey: str, fileList: List[Path], dateTags: Dict[str, str | int | float], fileIndex: Dict[str, int] | None = None) -> Tuple[str, str] | None:
+    """
+    Lets the user pick the date of creation of a file, from all the date tags the file has
+    or the date inferred from previous files.
 
-    # # Load the JSON metadata: dict with filename as str key and metadataDict as value
-    # with open(jsonFile, "r") as readFile:
-    #     jsonData = load(readFile)
+    Args:
+        jsonData: and OrderedDict with the JSON data containing the creation dates of the files in the current folder
+        jsonKey: the key for the jsonData ordered Dict (a file path, as a string) of the file to infer.
+        fileList: a naturally ordered list of files (so we can check the "previous files")
+        dateTags: the date tags of the file, as returned by `exiftool -json -time:all -G1 -a -s`
+        fileIndex: the position of each file of fileList (as a string) in it, see inferDateFromFile
 
-    with ExifTool() as et:
-        datesList: List = et.execute(
-            "-time:all", "-G1", "-a", "-s", jsonKey).splitlines()
-        # print(datesList)
-        debugPrint(lvl.INFO, "Found these date tags:")
-        # Print the dates found in the file
-        idx: int = 0
-        for idx, date_ in enumerate(datesList):
-            idx += 1
-            debugPrint(lvl.INFO, f"{idx}) {date_}")
-        # Add an entry to the list with the inferred date based on filename.
+    Returns:
+        The date and time picked for the file, or None if the user wants to save and quit
+    """
+    # The tags for this file were extracted in a single ExifTool call for all the dateless
+    # files, so there is no need to launch ExifTool here
+    # Keep only the tags that hold a date we can use, with the date already extracted, so
+    # the one picked doesn't have to be searched again
+    datesList: List[Tuple[str, str]] = []
+    for tag, value in dateTags.items():
+        # exiftool -j writes number-like values (SubSecTime*, etc.) as JSON numbers, and
+        # those never hold a date
+        if not isinstance(value, str):
+            continue
+        dateMatch = dateTimeRegEx.search(value)
+        if dateMatch is not None:
+            datesList.append((f"[{tag}]\t: {value}", dateMatch[0]))
+    debugPrint(lvl.INFO, "Found these date tags:")
+    # Print the dates found in the file
+    idx: int = 0
+    for idx, (label_, _) in enumerate(datesList):
         idx += 1
-        inferDate, inferTime = inferDateFromFile(jsonData, jsonKey, fileList)
-        debugPrint(
-            lvl.INFO, f"{idx}) Inferred from filename: \t\t: {inferDate} {inferTime}")
-        debugPrint(
-            lvl.OK, f"Do you want to pick one of these dates [1-{idx}]? (0 to skip this file, -1 if you are bored and want to save and quit)")
-        # Read selected date from console. If the input is not an int, return -1
-        try:
-            chosenIdx = int(input())
-        except:
-            chosenIdx = 0
-        # Pick one of the dates passed, if the index exists, or infer date otherwise
-        try:
-            if chosenIdx > 0 and chosenIdx < idx:
-                result = dateTimeRegEx.search(
-                    datesList[chosenIdx - 1])  # list is 0-indexed
-                if result:
-                    newDate, newTime = result[0].split()
-            elif chosenIdx == idx:
-                newDate, newTime = inferDate, inferTime
-            elif chosenIdx < 0:
-                # You are bored, save and exit
-                jsonData = orderDictByDate(jsonData)
-                with open(jsonFileName, "w+") as write_file:
-                    dump(jsonData, write_file)
-                exit(0)
-            else:
-                # skip the file from being tagged
-                skipFileFlag = True
-        except IndexError:
-            # if the input was not an int, skip this file
+        debugPrint(lvl.INFO, f"{idx}) {label_}")
+    # Add an entry to the list with the inferred date based on filename.
+    idx += 1
+    inferDate, inferTime = inferDateFromFile(jsonData, jsonKey, fileList, fileIndex)
+    debugPrint(
+        lvl.INFO, f"{idx}) Inferred from filename: \t\t: {inferDate} {inferTime}")
+    debugPrint(
+        lvl.OK, f"Do you want to pick one of these dates [1-{idx}]? (0 to skip this file, -1 if you are bored and want to save and quit)")
+    # Read selected date from console. If the input is not an int, return -1
+    try:
+        chosenIdx = int(input())
+    except:
+        chosenIdx = 0
+    # Pick one of the dates passed, if the index exists, or infer date otherwise
+    skipFileFlag: bool = False
+    try:
+        if chosenIdx > 0 and chosenIdx < idx:
+            newDate, newTime = datesList[chosenIdx - 1][1].split()  # list is 0-indexed
+        elif chosenIdx == idx:
+            newDate, newTime = inferDate, inferTime
+        elif chosenIdx < 0:
+            # You are bored, let the caller save and exit
+            return None
+        else:
+            # skip the file from being tagged
             skipFileFlag = True
+    except IndexError:
+        # if the input was not an int, skip this file
+        skipFileFlag = True
 
-        if skipFileFlag:
-            # skipped the file, return an empty date
-            newDate, newTime = emptyDate.split()
-        return newDate, newTime
+    if skipFileFlag:
+        # skipped the file, return an empty date
+        newDate, newTime = emptyDate.split()
+    return newDate, newTime
 
 
 ####
@@ -353,8 +413,8 @@ def fixDateWithInferred(jsonFile: Path, filesToFix: List[str], photosFolder: Pat
     pathsToFix = natsorted(pathsToFix)
 
     # Load the JSON metadata: dict with filename as str key and metadataDict as value
-    with open(jsonFile, "r") as readFile:
-        jsonData = load(readFile)
+    with open(jsonFile, "rb") as readFile:
+        jsonData = loads(readFile.read())
 
     # DICT COMPREHENSION: just the dateless entries. Notice that we only use them to find the keys that are dateless
     # but we always store the results on jsonData, which contains both dateless and dated elements!
@@ -401,7 +461,7 @@ def fixDateWithInferred(jsonFile: Path, filesToFix: List[str], photosFolder: Pat
         with alive_bar(totalNumFiles) as bar:
             for key in changesDict:
                 bar()
-                if (file_.suffix).lower() in (photoExtensions + videoExtensions):
+                if (file_.suffix).lower() in mediaExtensions:
                     # Replace all time tags THAT EXIST (don't create new ones) with newDate
                     if not executeExifTool(et, ["-ee", "-wm", "w", f"-time:all={changesDict[key]}", "-overwrite_original", key]):
                         debugPrint(
@@ -416,8 +476,7 @@ def fixDateWithInferred(jsonFile: Path, filesToFix: List[str], photosFolder: Pat
     # All files must have dates now. Reorder dictionary with the new changes, and store in
     # the JSON file
     jsonData = orderDictByDate(jsonData)
-    with open(jsonFileName, "w+") as write_file:
-        dump(jsonData, write_file)
+    writeJSON(jsonData)
 
 ####
 # File finders: return list of files based certain criteria
@@ -438,8 +497,16 @@ def hasManufacturer(fileName: Path, ExifToolData: Dict) -> bool:
     # Checks for make and model
     hasManufacturerFlag: bool = False
 
-    hasMake = any("make" in key.lower() for key in ExifToolData.keys())
-    hasModel = any("model" in key.lower() for key in ExifToolData.keys())
+    # Look for both tags in a single pass over the keys, lowercasing each key only once, and
+    # stop as soon as both are found
+    hasMake: bool = False
+    hasModel: bool = False
+    for key in ExifToolData:
+        lowerKey = key.lower()
+        hasMake = hasMake or "make" in lowerKey
+        hasModel = hasModel or "model" in lowerKey
+        if hasMake and hasModel:
+            break
 
     if hasMake and hasModel:
         hasManufacturerFlag = True
@@ -469,12 +536,13 @@ def isScreenShot(fileName: Path, ExifToolData: Dict) -> bool:
     """
     # screenshots
     isScreenShotFlag: bool = False
-    if "XMP:UserComment" in ExifToolData:
-        if ExifToolData["XMP:UserComment"].lower() == "screenshot":
+    userComment: str | None = ExifToolData.get("XMP:UserComment")
+    if userComment is not None:
+        if userComment.lower() == "screenshot":
             isScreenShotFlag = True
         else:
             debugPrint(
-                lvl.WARNING, f"UserComment in {fileName.name} is {ExifToolData['XMP:UserComment']}")
+                lvl.WARNING, f"UserComment in {fileName.name} is {userComment}")
 
     # We didn't find the correct tag
     return isScreenShotFlag
@@ -492,15 +560,16 @@ def hasSidecar(fileName: Path) -> bool:
         True if there's a sidecar with the same name, False otherwise
     """
 
-    sidecar = (Path(fileName.parent) /
-               Path(fileName.stem).with_suffix(".aae"))
+    # Build the candidates as plain strings, instead of several intermediate Paths
+    parent: str = str(fileName.parent)
+    stem: str = fileName.stem
+    sidecar: str = join(parent, stem + ".aae")
     # for some reason, sometimes they append an 'O' to the name of the file?
-    sidecarO = (Path(fileName.parent) /
-                Path(fileName.stem + "O")).with_suffix(".aae")
-    if sidecar.is_file():
+    sidecarO: str = join(parent, stem + "O.aae")
+    if isfile(sidecar):
         # debugPrint(lvl.OK, f"sidecar for {fileName.stem}{fileName.suffix} found")
         return True
-    elif sidecarO.is_file():
+    elif isfile(sidecarO):
         # debugPrint(lvl.OK, f"sidecar for {fileName.stem}{fileName.suffix} found (with O suffix)")
         return True
     else:
@@ -543,21 +612,56 @@ def fixDateless(jsonData: OrderedDict[str, metadataDict] , filesToFix: List[str]
     # Finally, we replace the metadata in the file with the newly found data, so we can
     # proceed to rename
     with ExifTool() as et:
+        # For the interactive method, grab the date tags of all the files to fix in a single
+        # ExifTool call, instead of calling ExifTool once per file. -fast only skips the
+        # trailers. Not -fast2: it also stops at the mdat atom of QuickTime files, and
+        # videos keep their dates in the moov atom, which usually comes after it
+        dateTagsByFile: Dict[str, Dict[str, str | int | float]] = dict()
+        if inferMethod == "interactive" and pathsToFix:
+            try:
+                dateTagsByFile = {entry["SourceFile"]: entry for entry in et.execute_json(
+                    "-fast", "-time:all", "-G1", "-a", "-s", *[str(file_) for file_ in pathsToFix])}
+            except ExifToolOutputEmptyError:
+                # None of the files could be read by ExifTool, they will be shown without dates
+                pass
+        # Where each file is in the folder, so the inference doesn't have to search for the
+        # file in the list for every dateless file
+        fileIndex: Dict[str, int] = {str(file): idx for idx, file in enumerate(filesInFolder)}
+        # Dates picked on a previous interactive run that were never applied. They are kept
+        # apart from the JSON, so the files stay dateless until the changes are applied
+        pickedDates: Dict[str, List[str]] = dict()
+        if inferMethod == "interactive" and isfile(checkpointFileName):
+            with open(checkpointFileName, "rb") as readFile:
+                pickedDates = loads(readFile.read())
         # We loop through datelessItems, and will get a date for it with the inference method selected for each file
         changesDict: dict[str, str] = dict()
         # Build changesDict, a dict with a date for each file, and print in screen. We will ask if we are happy
         # with the changes before applying them
-        for file_ in pathsToFix:
+        for filesDone, file_ in enumerate(pathsToFix, 1):
             # The key for the JSON file is the path to the file to fix as a string
             key = str(file_)
             newDate: str = ""
             newTime: str = ""
             if (inferMethod == "fileInfer"):
                 newDate, newTime = inferDateFromFile(
-                    jsonData, key, filesInFolder)
+                    jsonData, key, filesInFolder, fileIndex)
             elif (inferMethod == "interactive"):
-                newDate, newTime = inferDateInteractive(
-                    jsonData, key, filesInFolder)
+                if key in pickedDates:
+                    newDate, newTime = pickedDates[key]
+                else:
+                    pickedDate = inferDateInteractive(
+                        jsonData, key, filesInFolder, dateTagsByFile.get(key, {}), fileIndex)
+                    if pickedDate is None:
+                        # You are bored: save the JSON with the dates picked so far and exit.
+                        # The JSON holds all the picks now, so the checkpoint is not needed
+                        writeJSON(orderDictByDate(jsonData))
+                        if isfile(checkpointFileName):
+                            remove(checkpointFileName)
+                        exit(0)
+                    newDate, newTime = pickedDate
+                    # Skipped files are not saved, so they are offered again on the next run
+                    if f"{newDate} {newTime}" != emptyDate:
+                        pickedDates[key] = [newDate, newTime]
             debugPrint(lvl.OK, f"Chose {newDate} {newTime}")
             jsonData[key]['date'] = newDate
             jsonData[key]['time'] = newTime
@@ -568,6 +672,11 @@ def fixDateless(jsonData: OrderedDict[str, metadataDict] , filesToFix: List[str]
             tagValue: str = newDate + " " + newTime
             # The tag to use depends on whether it's a video or a photo:
             changesDict[key] = tagValue
+            # Picking dates by hand takes a while, so save the picks every now and then. A new
+            # run will reuse them instead of asking again
+            if inferMethod == "interactive" and filesDone % autoSaveEvery == 0:
+                with open(checkpointFileName, "wb") as writeFile:
+                    writeFile.write(dumps(pickedDates))
          # Ask if we are happy with the changes propossed
         debugPrint(
             lvl.WARNING, "Are you happy with these dates? (y/n or p if you want to print a list of changes)")
@@ -576,12 +685,15 @@ def fixDateless(jsonData: OrderedDict[str, metadataDict] , filesToFix: List[str]
             for key in changesDict:
                 debugPrint(lvl.INFO, f"{Path(key).name} -> {changesDict[key]}")
         elif response != "y":
+            # The picks were rejected, don't offer them again on the next run
+            if isfile(checkpointFileName):
+                remove(checkpointFileName)
             return  # nothing to do, return from function now
         # Else, apply the changes
         with alive_bar(totalNumFiles) as bar:
             for key in changesDict:
                 bar()
-                if (file_.suffix).lower() in (photoExtensions + videoExtensions):
+                if (file_.suffix).lower() in mediaExtensions:
                     # Replace all time tags THAT EXIST (don't create new ones) with newDate
                     if not executeExifTool(et, ["-ee", "-wm", "w", f"-time:all={changesDict[key]}", "-overwrite_original", key]):
                         debugPrint(
@@ -596,8 +708,63 @@ def fixDateless(jsonData: OrderedDict[str, metadataDict] , filesToFix: List[str]
     # All files must have dates now. Reorder dictionary with the new changes, and store in
     # the JSON file
     jsonData = orderDictByDate(jsonData)
-    with open(jsonFileName, "w+") as write_file:
-        dump(jsonData, write_file)
+    writeJSON(jsonData)
+    # The picked dates are applied now, the checkpoint is no longer needed
+    if isfile(checkpointFileName):
+        remove(checkpointFileName)
+
+
+def getFilesToExtract(path: Path) -> List[str]:
+    """
+    Returns the files in a folder (and its subfolders) that the batch processing extracts
+    tags from: the media files, and their .aae sidecars, so they can be found in the output.
+    Like ExifTool's -r, hidden subfolders are skipped
+
+    Args:
+        path: a Path to the folder
+
+    Returns:
+        a list with the path of each file, as a string
+    """
+    files: List[str] = []
+    foldersToVisit: List[str] = [str(path)]
+    while foldersToVisit:
+        with scandir(foldersToVisit.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        foldersToVisit.append(entry.path)
+                elif entry.is_file():
+                    suffix = splitext(entry.name)[1].lower()
+                    if suffix in mediaExtensions or suffix == ".aae":
+                        files.append(entry.path)
+    return files
+
+
+def extractTagsFromFiles(files: List[str]) -> List[Dict[str, str]]:
+    """
+    Extracts the tags in tagsToExtract from a list of files, with its own ExifTool instance,
+    so several lists can be processed at the same time
+
+    Args:
+        files: the paths to the files to process, as strings
+
+    Returns:
+        A list with a dict of tags for each file, as provided by ExifTool
+    """
+    with ExifTool() as et:
+        # Data to extract:
+        # CreateDate: time the file was written to flash (there's also DateTimeOriginal, which is when the shutter was actuated!)
+        # MediaCreateDate: alternative for video files to CreateDate, if that's missing
+        # Make and Model: used to determine if the doc comes from a "camera" or an "app"
+        # None of these live in the trailers of the files, so let ExifTool skip them with
+        # -fast. Not -fast2: it stops at the mdat atom of QuickTime files, and videos keep
+        # their dates, make and model in the moov atom, which usually comes after it
+        try:
+            return et.execute_json("-fast", *tagsToExtract, *files)
+        except ExifToolOutputEmptyError:
+            # None of the files could be read by ExifTool
+            return []
 
 
 def doExifToolBatchProcessing(path: Path) -> None:
@@ -608,23 +775,83 @@ def doExifToolBatchProcessing(path: Path) -> None:
         path: a Path to the folder to process
 
     """
-    files = getListOfFiles(path)
-    files = natsorted(files)
+    files: List[str] = getFilesToExtract(path)
     debugPrint(lvl.OK, f"Found {len(files)} files")
 
     # # Do batch processing with ExifTool: extract all the relevant tags for our files
+    # A single ExifTool is a single perl process, so split the files in one contiguous chunk
+    # of (about) the same size per CPU, each processed by its own ExifTool. The work happens
+    # in the ExifTool processes, so threads are enough to drive them.
+    # Starting an ExifTool takes a while, so for small folders, a single one does it quicker
+    numberOfWorkers: int = 1
+    if len(files) >= minFilesForParallelExifTool:
+        numberOfWorkers = min(len(files), cpu_count() or 1)
+    chunkSize: int = max(1, -(-len(files) // numberOfWorkers))  # Rounded up
+    chunks: List[List[str]] = [files[idx:idx + chunkSize] for idx in range(0, len(files), chunkSize)]
     start = time()
-    with ExifTool() as et:
-        # Data to extract:
-        # CreateDate: time the file was written to flash (there's also DateTimeOriginal, which is when the shutter was actuated!)
-        # MediaCreateDate: alternative for video files to CreateDate, if that's missing
-        # Make and Model: used to determine if the doc comes from a "camera" or an "app"
-        etData: List = et.execute_json(*tagsToExtract, str(path), "-r")
+    etData: List = []
+    if chunks:
+        with ThreadPool(len(chunks)) as pool:
+            for chunkData in pool.map(extractTagsFromFiles, chunks):
+                etData.extend(chunkData)
     debugPrint(
         lvl.OK, f"Processed {len(files)} files in {time() - start:0.02f}s")
 
-    with open(etJSON, "w+") as writeFile:
-        dump(etData, writeFile)
+    with open(etJSON, "wb") as writeFile:
+        writeFile.write(dumps(etData))
+
+
+def processExifToolEntry(entry: Dict[str, str], sidecars: Set[str]) -> Tuple[str, metadataDict] | None:
+    """
+    Generates the metadata needed in the renaming process for a file, from its ExifTool tags
+
+    Args:
+        entry: a dict with the metadata for the file, as provided by ExifTool
+        sidecars: the names (as in the "SourceFile" tag) of all the sidecars ExifTool found
+
+    Returns:
+        A tuple with the file name (as in the "SourceFile" tag) and its metadataDict, or None
+        if the file is not one we want to process
+    """
+    sourceFile: str = entry["SourceFile"]
+    # The extension decides everything below, get it once, from the string
+    suffix: str = splitext(sourceFile)[1]
+    lowerSuffix: str = suffix.lower()
+    # The batch processor of ExifTool processes all files in folder, so remove
+    # known bad extensions, before building any Path for them
+    if lowerSuffix in dontProcessExtensions:
+        return None
+    file: Path = Path(sourceFile)
+
+    date_: str = ""
+    time_: str = ""
+    isDatelessFlag: bool = False
+    # Get the screenshot value
+    isScreenShotFlag: bool = isScreenShot(file, entry)
+    # Has Manufacturer info?
+    hasManufacturerFlag: bool = hasManufacturer(file, entry)
+    # Get the hasSidecar value. Same candidates as hasSidecar, and case sensitive like it
+    # (massRenamer looks for these exact names), but looked up in memory instead of in the disk
+    baseName_: str = sourceFile[:len(sourceFile) - len(suffix)]
+    hasSidecarFlag: bool = baseName_ + ".aae" in sidecars or baseName_ + "O.aae" in sidecars
+    # Get time and date of creation
+    # Extract time for Images
+    if lowerSuffix in photoExtensions:
+        date_, isDatelessFlag = findCreationTime(
+            file, entry, photoTagsToCheck)
+    # Extract time for Video
+    elif lowerSuffix in videoExtensions:
+        date_, isDatelessFlag = findCreationTime(
+            file, entry, videoTagsToCheck)
+
+    try:
+        date_, time_ = date_.split()
+    except ValueError:
+        print(f"{file.name} {date_}")
+
+    item: metadataDict = {"date": date_, "time": time_, "dateless": isDatelessFlag,
+                          "screenshot": isScreenShotFlag, "hasSidecar": hasSidecarFlag, "hasManufacturer": hasManufacturerFlag}
+    return sourceFile, item
 
 
 def generateSortedJSON(path: Path) -> None:
@@ -639,8 +866,8 @@ def generateSortedJSON(path: Path) -> None:
     """
 
     etData = OrderedDict()
-    with open(etJSON, "r") as readFile:
-        etData = load(readFile)
+    with open(etJSON, "rb") as readFile:
+        etData = loads(readFile.read())
 
     # Create a JSON String with the data needed for the renaming process
     # See the metadataDict class for more info on the values
@@ -663,43 +890,18 @@ def generateSortedJSON(path: Path) -> None:
     # A OrderedDict using filenames as keys and date of creation as value
     jsonData: OrderedDict[str, metadataDict] = OrderedDict()
 
+    # ExifTool processes all the files in the folder, sidecars included, so we already know
+    # which sidecars exist: keep their names to look them up, instead of checking the disk
+    # for every file
+    sidecars: Set[str] = {entry["SourceFile"] for entry in etData if entry["SourceFile"].endswith(".aae")}
     for entry in etData:
-        file: Path = Path(entry["SourceFile"])
-        # The batch processor of ExifTool processes all files in folder, so remove
-        # known bad extensions
-        if file.suffix.lower() not in dontProcessExtensions:
-            date_: str = ""
-            time_: str = ""
-            isDatelessFlag: bool = False
-            # Get the screenshot value
-            isScreenShotFlag: bool = isScreenShot(file, entry)
-            # Has Manufacturer info?
-            hasManufacturerFlag: bool = hasManufacturer(file, entry)
-            # Get the hasSidecar value
-            hasSidecarFlag: bool = hasSidecar(file)
-            # Get time and date of creation
-            # Extract time for Images
-            if file.suffix.lower() in photoExtensions:
-                date_, isDatelessFlag = findCreationTime(
-                    file, entry, photoTagsToCheck)
-            # Extract time for Video
-            elif file.suffix.lower() in videoExtensions:
-                date_, isDatelessFlag = findCreationTime(
-                    file, entry, videoTagsToCheck)
-
-            try:
-                date_, time_ = date_.split()
-            except ValueError:
-                print(f"{file.name} {date_}")
-
-            item: metadataDict = {"date": date_, "time": time_, "dateless": isDatelessFlag,
-                                  "screenshot": isScreenShotFlag, "hasSidecar": hasSidecarFlag, "hasManufacturer": hasManufacturerFlag}
-            jsonData[entry["SourceFile"]] = item
+        result = processExifToolEntry(entry, sidecars)
+        if result is not None:
+            jsonData[result[0]] = result[1]
 
     # This sorts the dict based on the date of creation value (date, then time) of its keys
     jsonData = orderDictByDate(jsonData)
-    with open(jsonFileName, "w+") as write_file:
-        dump(jsonData, write_file)
+    writeJSON(jsonData)
 
 
 # Used to keep track of directory changes when traversing the FS
@@ -722,6 +924,8 @@ def massRenamer(jsonData: OrderedDict[str, metadataDict], photosDir: Path, isDry
     # how many zeroes the file index will have, so they are naturally sorted in the
     # file explorer
     dateHistogram = Counter(jsonData[key]['date'] for key in jsonData)
+    # Width of the file index for each date, worked out once per date instead of per file
+    numberOfZeroesByDate: Dict[str, int] = {date: len(str(count)) for date, count in dateHistogram.items()}
 
     # Counter used to name the files, starts on 1, and increases for each file with the
     # same capture date
@@ -731,7 +935,7 @@ def massRenamer(jsonData: OrderedDict[str, metadataDict], photosDir: Path, isDry
     prevDateStr: str = ""
     for key in jsonData:
         dateStr = jsonData[key]['date']
-        numberOfZeroes = len(str(dateHistogram[dateStr]))
+        numberOfZeroes = numberOfZeroesByDate[dateStr]
         # debugPrint(lvl.INFO, f"{dateStr} has {dateHistogram[dateStr]} files")
         # Check the current date, and if it's the same as the previous one, increase counter. Otherwise, reset it to 1
         if dateStr == prevDateStr:
@@ -838,15 +1042,15 @@ def test():
     # JSON file exists, process it. Pass the dryRun flag
 
     etData: List[OrderedDict] = []
-    with open(etJSON, "r") as readFile:
-        etData = load(readFile)
+    with open(etJSON, "rb") as readFile:
+        etData = loads(readFile.read())
 
     keyList: List[str] = []
     makeList: List[str] = []
     modelList: List[str] = []
     softwareList: List[str] = []
     for item in etData:
-        for key in item.keys():
+        for key in item:
             if key not in keyList:
                 keyList.append(key)
             if "Make" in key and key not in makeList:
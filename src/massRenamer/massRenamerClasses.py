@@ -41,24 +41,38 @@ Functions:
 # from alive_progress import alive_bar
 # from exiftool import ExifTool
 # from collections import OrderedDict, Counter
+from bisect import bisect_left
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 # from exiftool import ExifToolHelper
 # from json import dump, load
 # from natsort import natsorted
+from os import scandir
 from pathlib import Path
-# from re import compile
+from re import compile, ASCII, IGNORECASE
 # from time import time
 from time import strftime, strptime
-from typing import OrderedDict, Dict, Tuple, List, TypedDict, Match
+from typing import OrderedDict, Dict, Tuple, List, Set, TypedDict, Match
 
 # from ..support.support import lvl, debugPrint
 
 # Format strings for partsing datetimes in aware and naive formats (with and without UTC
 # offset). Annoyingly, to parse a datetime to string and have a semicolon in the offset,
 # you use the %:z token, but that token doesn't work when parsing strings to datetime!
-offsetAwareFormatParsing = '%Y:%m:%d %H:%M:%S%z'
-offsetAwareFormatStringing = '%Y:%m:%d %H:%M:%S%:z'
-offsetNaiveFormat = '%Y:%m:%d %H:%M:%S'
+# No longer used: parseDateTime goes through datetime.fromisoformat, and formatDateTime
+# builds the string itself
+# offsetAwareFormatParsing = '%Y:%m:%d %H:%M:%S%z'
+# offsetAwareFormatStringing = '%Y:%m:%d %H:%M:%S%:z'
+# offsetNaiveFormat = '%Y:%m:%d %H:%M:%S'
+
+# Searches for "YYYY:MM:DD HH:MM:SS" with an optional "[+/-]XX:XX" or "Z" offset. The offset
+# group is None for "naive" dates, so we can tell them apart without parsing them
+dateTimeRegEx = compile(r'\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}([\+\-]\d{2}:\d{2}|Z)?', ASCII)
+
+# Used to find the source of files without make or model, in their UserComment and Software
+# tags. Case insensitive, so we don't have to lowercase every value
+screenShotRegEx = compile(r'screenshot', IGNORECASE)
+instaOrFaceRegEx = compile(r'facebook|instagram', IGNORECASE)
 
 # # TODO: Software source: Apps leave a tag in Software, but so do iPhone photos.
 # # Software Instagram or Layout from Instagram
@@ -84,8 +98,9 @@ offsetNaiveFormat = '%Y:%m:%d %H:%M:%S'
 # # Filename to use the metadata obtained from the ExifTool batch processing
 # etJSON: str = "etJSON.json"
 
-# # define this to search for "0000:00:00 00:00:00", an empty date and time
-# emptyDate: str = "0000:00:00 00:00:00"
+# ExifTool reports tags that are present but were never set as "0000:00:00 00:00:00", an
+# empty date and time
+emptyDate: str = "0000:00:00 00:00:00"
 
 # # The List of tags to extract with exiftool
 # # HACK: sometimes, the filemodifydate tag can help, but it can also be quite harmful, so
@@ -201,6 +216,10 @@ offsetNaiveFormat = '%Y:%m:%d %H:%M:%S'
 # Creation date finder
 ####
 
+# The tags holding the time offset for the date tags that have one
+offsetTagForDateTag: Dict[str, str] = {"EXIF:CreateDate": "EXIF:OffsetTimeDigitized",
+                                       "EXIF:DateTimeOriginal": "EXIF:OffsetTimeOriginal"}
+
 def getTimeOffset(exifToolData: Dict[str, str], exifTag:str):
     """
     Adds time offset to strings containing "naive" dateTime objects. If the dictionary
@@ -216,29 +235,57 @@ def getTimeOffset(exifToolData: Dict[str, str], exifTag:str):
     """
     dateString_:str = exifToolData[exifTag]
 
-    # Check if object is naive
-    try:
-        datetime.strptime(dateString_, offsetNaiveFormat)
-    except ValueError:
+    # Check if object is naive: a date with no offset group
+    dateMatch = dateTimeRegEx.fullmatch(dateString_)
+    if dateMatch is None or dateMatch[1] is not None:
         print(f"String does not contain a date in the correct format -> '{dateString_}'")
-        raise
-    # try to get offset from tags
-    offset_:str = "+00:00"
-    if exifTag == "EXIF:CreateDate":
-        if "EXIF:OffsetTimeDigitized" in exifToolData.keys():
-            offset_ = exifToolData["EXIF:OffsetTimeDigitized"]
-    elif exifTag == "EXIF:DateTimeOriginal":
-        if "EXIF:OffsetTimeOriginal" in exifToolData.keys():
-            offset_ = exifToolData["EXIF:OffsetTimeOriginal"]
-    # Otherwise, no tags associated, offset is still +00:00
+        raise ValueError(f"'{dateString_}' is not a naive date")
+    # try to get offset from tags. Otherwise, no tags associated, offset is +00:00
+    offset_:str = exifToolData.get(offsetTagForDateTag.get(exifTag, ""), "+00:00")
     # Special case, sometimes offset is Z, for Zulu -> UTC
     if offset_ == "Z":
         offset_ ="+00:00"
     return dateString_ + offset_
 
+@lru_cache(maxsize=4096)
+def parseDateTime(dateString: str) -> datetime:
+    """
+    Parses an "aware" date string, with format 'YYYY:MM:DD HH:MM:SS[+-]HH:MM' (or 'Z' as
+    offset) into a datetime. Swapping the colons of the date for dashes turns it into
+    an ISO 8601 string, which the C implemented datetime.fromisoformat parses way quicker
+    than strptime (and than slicing the fields by hand).
+    Files shot in bursts, or live photos and their videos, share the same dates, and
+    datetimes are immutable, so the results are cached across files.
+
+    Args:
+        dateString: a string containing a date with time offset
+
+    Returns:
+        an aware datetime object
+    """
+    return datetime.fromisoformat(f"{dateString[0:4]}-{dateString[5:7]}-{dateString[8:10]}T{dateString[11:]}")
+
+def formatDateTime(date: datetime) -> str:
+    """
+    Turns an aware datetime into a string with format 'YYYY:MM:DD HH:MM:SS[+-]HH:MM'. The
+    format is fixed, so an f-string is quicker than strftime, and it doesn't depend on the
+    platform supporting the %:z token
+
+    Args:
+        date: an aware datetime object
+
+    Returns:
+        a string with the date, time and offset
+    """
+    offsetMinutes_: int = int((date.utcoffset() or timedelta(0)).total_seconds()) // 60
+    sign_: str = "+" if offsetMinutes_ >= 0 else "-"
+    offsetMinutes_ = abs(offsetMinutes_)
+    return (f"{date.year:04d}:{date.month:02d}:{date.day:02d} {date.hour:02d}:{date.minute:02d}:{date.second:02d}"
+            f"{sign_}{offsetMinutes_ // 60:02d}:{offsetMinutes_ % 60:02d}")
+
 # These are the tags that I'm capturing with EXIFTool about creation time
-dateTagsToCheck: List[str] = ["EXIF:DateTimeOriginal", "QuickTime:DateTimeOriginal", "XMP:DateTimeOriginal",
-                              "EXIF:CreateDate", "QuickTime:CreateDate", "PNG:CreateDate", "XMP:CreateDate", "QuickTime: CreationDate"]
+dateTagsToCheck: Tuple[str, ...] = ("EXIF:DateTimeOriginal", "QuickTime:DateTimeOriginal", "XMP:DateTimeOriginal",
+                                    "EXIF:CreateDate", "QuickTime:CreateDate", "PNG:CreateDate", "XMP:CreateDate", "QuickTime:CreationDate")
 # NOTE: Keeping this one for later, and thinking about capturing Track* in videos: is there a video that has no
 # CreateDate but has track? unlikely
 videoTagsToCheck: List[str] = ["File:FileModifyDate"]
@@ -267,45 +314,42 @@ def findCreationTime(exifToolData: Dict[str, str]) -> str | None:
         string if there is no valid date tags in the dictionary.
     """
 
-    datesFound: List[datetime] = []
-    # Gather all the date data from the tags we are interested in checking
+    oldestDate_: datetime | None = None
+    # Most files repeat the same date in several tags (CreateDate and DateTimeOriginal, for
+    # example), keep the ones already checked so they are only parsed once
+    seenDates_: Set[str] = set()
+    # Bound method, so each tag is fetched with a single lookup, instead of checking if it's
+    # in the dict and then reading it
+    getTag = exifToolData.get
+    # Gather all the date data from the tags we are interested in checking, keeping the oldest
     for tag in dateTagsToCheck:
-        # if tag exists, grab store value in datesFound
-        if tag in exifToolData:
-            dateString_: str = exifToolData[tag]
-            # We either have a datetime object that is aware, or we have a naive with an
-            # offset. Turn back into string and store
-            try:
-                datetime.strptime(dateString_, offsetNaiveFormat)
-                # if dateString is "naive" see if we can get the offset
-                dateString_ = getTimeOffset(exifToolData, tag)
-            except:
-                pass
-            # Else, the dateString is "aware"
-            # Store the date as datetime object, so we can sort it later
-            datesFound.append(datetime.strptime(dateString_, offsetAwareFormatParsing))
-
-    if datesFound:
-        datesFound = sorted(datesFound)
-        # Pick the first element of the sorted array (sorted from oldest to newest) to get
-        # the oldest date
-        oldestDate_ = datesFound[0]
-        # But there might be a couple of dates that are the "same", with and without offset
-        # The sorting algo favours UTC over dates with offset, so that means that we can
-        # potentially loose it on those scenarios. Loop the array for other dates equivalent
-        # the picked one, but with an offset
-        for date in datesFound:
-            if date == oldestDate_:
-                # if dates are still the same, prefer the one with the delta
-                if date.utcoffset() != timedelta(0):
-                    oldestDate_ = date
-                    # and stop searching. If there are more equivalent dates with other
-                    # deltas... well that's a mess anyway. Let's stop this madness here.
-                    break
-            else:
-                # if dates are different, we can stop searching
-                break
-        return oldestDate_.strftime('%Y:%m:%d %H:%M:%S%:z')
+        dateString_: str | None = getTag(tag)
+        # if tag exists (and has a date), compare it with the oldest found so far
+        if dateString_ is None or dateString_.startswith(emptyDate):
+            continue
+        # We either have a datetime object that is aware, or we have a naive with an
+        # offset. Turn back into string and store
+        dateMatch = dateTimeRegEx.fullmatch(dateString_)
+        if dateMatch is None:
+            raise ValueError(f"String does not contain a date in the correct format -> '{dateString_}'")
+        if dateMatch[1] is None:
+            # if dateString is "naive" see if we can get the offset
+            dateString_ = getTimeOffset(exifToolData, tag)
+        # Else, the dateString is "aware"
+        if dateString_ in seenDates_:
+            continue
+        seenDates_.add(dateString_)
+        date = parseDateTime(dateString_)
+        if oldestDate_ is None or date < oldestDate_:
+            oldestDate_ = date
+        elif date == oldestDate_ and not oldestDate_.utcoffset() and date.utcoffset():
+            # But there might be a couple of dates that are the "same", with and without
+            # offset. If that's the case, prefer the first one with the delta. If there
+            # are more equivalent dates with other deltas... well that's a mess anyway.
+            oldestDate_ = date
+
+    if oldestDate_ is not None:
+        return formatDateTime(oldestDate_)
     # Else, no dates were found, return empty string, this element is "dateless", we will
     # have to rely in file system data (unreliable) or infer by name, based on neighboring
     # dated elements.
@@ -315,7 +359,35 @@ def findCreationTime(exifToolData: Dict[str, str]) -> str | None:
 # File Source finders: determines the source of different types of files
 ####
 
-def isScreenShot(exifToolData: Dict[str, str]) -> bool:
+def classifyTags(exifToolData: Dict[str, str]) -> Tuple[List[str], List[str], List[str], List[str]]:
+    """
+    Sorts the values of the tags used to find the source of a file, in a single pass over
+    the tags. Tags are matched by a partial, case insensitive match of their names, so
+    "EXIF:Model" and "QuickTime:Model" are both "model" tags.
+
+    Args:
+        ExifToolData: a dict with the metadata for the file, as provided by ExifTool
+
+    Returns:
+        Four lists, with the values of the "model", "make", "software" and "usercomment" tags
+    """
+    models: List[str] = []
+    makes: List[str] = []
+    software: List[str] = []
+    userComments: List[str] = []
+    for key, value in exifToolData.items():
+        lowerKey = key.lower()
+        if "model" in lowerKey:
+            models.append(value)
+        elif "make" in lowerKey:
+            makes.append(value)
+        elif "software" in lowerKey:
+            software.append(value)
+        elif "usercomment" in lowerKey:
+            userComments.append(value)
+    return models, makes, software, userComments
+
+def isScreenShot(exifToolData: Dict[str, str], userComments: List[str] | None = None) -> bool:
     """
     Checks if a file is a screenshot.
     On iOS, screenshots are tagged as such by adding a "UserComment" tag with the contents
@@ -323,50 +395,34 @@ def isScreenShot(exifToolData: Dict[str, str]) -> bool:
 
     Args:
         ExifToolData: a dict with the metadata for the file, as provided by ExifTool
+        userComments: the values of the "UserComment" tags, if they were already found
 
     Returns:
         true if it is, false otherwise
     """
-    # screenshots
-    isScreenShotFlag: bool = False
-    # If there's any key with partial match with "UserComment", the list comprehension
-    # will not be empty
-    userCommentKeys = [key for key in exifToolData.keys() if "usercomment" in key.lower()]
-    # Check for each key, while the flag is false, if the UserComment is "screenshot"
-    if userCommentKeys != []:
-        for key in userCommentKeys:
-            # stop searching if one key with screenshot is found
-            if isScreenShotFlag == False and "screenshot" in exifToolData[key].lower():
-                isScreenShotFlag = True
-    # Else, no "comment" keys, return false
-
-    return isScreenShotFlag
-
-def isInstaOrFace(exifToolData: Dict[str, str]) -> bool:
+    if userComments is None:
+        userComments = classifyTags(exifToolData)[3]
+    # Check the contents of any key with a partial match with "UserComment", and stop
+    # searching if one with "screenshot" is found
+    return any(screenShotRegEx.search(comment) for comment in userComments)
+
+def isInstaOrFace(exifToolData: Dict[str, str], software: List[str] | None = None) -> bool:
     """
     Checks if a file is from Instagram / Facebook Apps.
     We check for partial matches of "instagram" or "facebook" in the EXIF:Software tag
 
     Args:
         ExifToolData: a dict with the metadata for the file, as provided by ExifTool
+        software: the values of the "Software" tags, if they were already found
 
     Returns:
         true if it is, false otherwise
     """
-
-    isInstaFlag: bool = False
-    # If there's any key with partial match with "Software", the list comprehension
-    # will not be empty
-    softwareKeys = [key for key in exifToolData.keys() if "software" in key.lower()]
-    # Check for each key, while the flag is false, if the UserComment contains "facebook"
-    # or "instagram"
-    if softwareKeys != []:
-        for key in softwareKeys:
-            # stop stearching if one key with screenshot is found
-            if isInstaFlag == False and "facebook" in exifToolData[key].lower() or "instagram" in exifToolData[key].lower():
-                isInstaFlag = True
-
-    return isInstaFlag
+    if software is None:
+        software = classifyTags(exifToolData)[2]
+    # Check the contents of any key with a partial match with "Software", and stop
+    # searching if one with "facebook" or "instagram" is found
+    return any(instaOrFaceRegEx.search(value) for value in software)
 
 def isPicsArt(exifToolData: Dict[str, str]) -> bool:
     """
@@ -379,11 +435,8 @@ def isPicsArt(exifToolData: Dict[str, str]) -> bool:
     Returns:
         true if it is, false otherwise
     """
-
-    if "EXIF:Software" in exifToolData.keys() and exifToolData["EXIF:Software"] == "PicsArt":
-        return True
-
-    return False
+    # Only the exact EXIF:Software tag counts, so a single lookup does it
+    return exifToolData.get("EXIF:Software") == "PicsArt"
 
 def getFileSource(exifToolData: Dict[str, str]) -> str:
     """
@@ -398,11 +451,9 @@ def getFileSource(exifToolData: Dict[str, str]) -> str:
         A string to use as the name pattern for the file, with the source of the file (a
         camera model, an app name, screenshot, ...)
     """
-    # Checks for make and model
-    hasManufacturerFlag: bool = False
-
-    hasMake = any("make" in key.lower() for key in exifToolData.keys())
-    hasModel = any("model" in key.lower() for key in exifToolData.keys())
+    # Sort the tags we are interested in, in a single pass, and share them with all the
+    # checks below
+    models, makes, software, userComments = classifyTags(exifToolData)
 
     # NOTE: about make and model
     # So far, I found 3 "make" tags: EXIF (photos), QuickTime (Apple video) and XMP
@@ -410,32 +461,28 @@ def getFileSource(exifToolData: Dict[str, str]) -> str:
     # No files had Quicktime and XMP make tags.
     # The same is true about "model"
 
-    if hasModel:
-        # if it has model, use it as naming pattern.
-        modelKeyList:List[str] = [key for key in exifToolData if "model" in key.lower()]
-        # If more than one "model" tags are present, check that all report the same model
-        if len(modelKeyList) > 1:
-            if len(set([exifToolData[model] for model in modelKeyList])) != 1:
-                raise Exception(f"Multiple mismatching 'model' tags found in {exifToolData['SourceFile']}: {modelKeyList}")
-        # Grab the first model tag and return it's value
-        modelKey = modelKeyList[0]
-        return exifToolData[modelKey]
-    elif hasMake:
-        # if we don't have a model, but we have a make, use that. Same algo as above
-        makeKeyList:List[str] = [key for key in exifToolData if "make" in key.lower()]
-        # If more than one "make" tags are present, check that all report the same model
-        if len(makeKeyList) > 1:
-            if len(set([exifToolData[make] for make in makeKeyList])) != 1:
-                raise Exception(f"Multiple mismatching 'make' tags found in {exifToolData['SourceFile']}: {makeKeyList}")
-        # Grab the first model tag and return it's value
-        makeKey = makeKeyList[0]
-        return exifToolData[makeKey]
+    # if it has model, use it as naming pattern.
+    if models:
+        # If more than one "model" tags are present, check that all report the same model.
+        # Almost always there's only one, or they match, so compare them with the first one
+        # instead of building a set
+        if any(model != models[0] for model in models):
+            raise Exception(f"Multiple mismatching 'model' tags found in {exifToolData.get('SourceFile')}: {models}")
+        # Grab the model and return it
+        return models[0]
+    # if we don't have a model, but we have a make, use that. Same algo as above
+    elif makes:
+        # If more than one "make" tags are present, check that all report the same make
+        if any(make != makes[0] for make in makes):
+            raise Exception(f"Multiple mismatching 'make' tags found in {exifToolData.get('SourceFile')}: {makes}")
+        # Grab the make and return it
+        return makes[0]
     else:
         # No make or model: file doesn't come from a camera, or the metadata was lost
         # Let's do some checks, to try to find the source, otherwise apply the "WhatsApp" tag
-        if isScreenShot(exifToolData):
+        if isScreenShot(exifToolData, userComments):
             return "Screenshot"
-        elif isInstaOrFace(exifToolData):
+        elif isInstaOrFace(exifToolData, software):
             return "Insta_FaceBook"
         elif isPicsArt(exifToolData):
             return "PicsArt"
@@ -443,6 +490,26 @@ def getFileSource(exifToolData: Dict[str, str]) -> str:
         else:
             return "WhatsApp"
 
+@lru_cache(maxsize=256)
+def sidecarsInFolder(folder: Path) -> Dict[str, str]:
+    """Lists the sidecars in a folder, so we don't have to check the file system once per
+    file and sidecar pattern. The result is cached per folder, so call
+    `sidecarsInFolder.cache_clear()` if sidecars are moved around during a run
+
+    Args:
+        folder (Path): a Path to the folder to check for sidecars
+
+    Returns:
+        A dict with the lowercase names of the sidecars as keys, and their names as values
+    """
+    try:
+        with scandir(folder) as entries:
+            return {entry.name.lower(): entry.name for entry in entries
+                    if entry.name.lower().endswith(".aae") and entry.is_file()}
+    except OSError:
+        # folder doesn't exist, or can't be read, so no sidecars either
+        return {}
+
 def getSidecar(fileName: Path) -> Path | None:
     """Finds if a file has a sidecar associated with it
     For an image with name pattern `name.ext`, sidecars have the name pattern of `name.aae`
@@ -455,20 +522,17 @@ def getSidecar(fileName: Path) -> Path | None:
         The path to a sidecar, if exists, or None if not found
     """
 
-    sidecar = (Path(fileName.parent) /
-               Path(fileName.stem).with_suffix(".aae"))
+    sidecars = sidecarsInFolder(fileName.parent)
+    stem = fileName.stem.lower()
+    sidecar = sidecars.get(stem + ".aae")
     # for some reason, sometimes they append an 'O' to the name of the file?
-    sidecarO = (Path(fileName.parent) /
-                Path(fileName.stem + "O")).with_suffix(".aae")
-    if sidecar.is_file():
+    if sidecar is None:
+        sidecar = sidecars.get(stem + "o.aae")
+    if sidecar is not None:
         # debugPrint(lvl.OK, f"sidecar for {fileName.stem}{fileName.suffix} found")
-        return sidecar
-    elif sidecarO.is_file():
-        # debugPrint(lvl.OK, f"sidecar for {fileName.stem}{fileName.suffix} found (with O suffix)")
-        return sidecarO
-    else:
-        # debugPrint(lvl.ERROR, f"No sidecar for {fileName} / {fileName.stem}{fileName.suffix}")
-        return None
+        return fileName.parent / sidecar
+    # debugPrint(lvl.ERROR, f"No sidecar for {fileName} / {fileName.stem}{fileName.suffix}")
+    return None
 
 # def doExifToolBatchProcessing(path: Path) -> None:
 #     """
@@ -779,20 +843,23 @@ class MediaFile:
     --------------------
     _fileName: Path
         filename of the media file
-    _dateTime: str
-        The date of creation: string with format YYYY:MM:DD (default: "")
-    _time: str
-        The time of creation: string with format HH:MM:SS (default: "")
-    _isDateless: bool
-        Flag to indicate if the object has no date (default: True)
-    _hasSidecar: bool
-        Flag to indicate if object has sidecar (default: False)
+    _dateTime: str | None
+        The date and time of creation: string with format 'YYYY:MM:DD hh:mm:ss+HH:MM', or
+        None if the file is dateless
+    _dateTimeParsed: datetime | None
+        _dateTime as an aware datetime, parsed the first time it's needed
     _source: str
         Origin of the file: iPhone, WhatsApp, screenshot, camera... (default: "")
 
     Methods:
     --------
+    getTime: returns _dateTime
+    getTimeParsed: returns _dateTimeParsed, parsing _dateTime if it wasn't yet
     """
+    # There will be one instance per file in the folder, so use slots instead of a dict per
+    # instance. Keep it in sync with the attributes set in __init__!
+    __slots__ = ("_fileName", "_dateTime", "_dateTimeParsed", "_source")
+
     def __init__(self, fileName:Path, dateTime: str | None, source: str):
         """
         Attributes:
@@ -800,22 +867,35 @@ class MediaFile:
         _fileName: Path
             filename of the media file
         _dateTime: str
-            The date and time of creation: string with format 'YYYY:MM:DD hh:mm:ss', or
-            None if it has not been determined yet..
-        _sidecar: Path
-            If the file has a sidecar, path to it, or empty path if it doesn't have one (default: "")
+            The date and time of creation: string with format 'YYYY:MM:DD hh:mm:ss+HH:MM',
+            or None if it has not been determined yet..
         _source: str
             Origin of the file: iPhone, WhatsApp, screenshot, camera... (default: "")
         """
-        self_filename: Path = fileName
+        self._fileName: Path = fileName
         self._dateTime: str | None = dateTime
-        # self._sidecar:Path | None = getSidecar(fileName)
+        # The date of creation as an aware datetime, parsed the first time it's needed
+        self._dateTimeParsed: datetime | None = None
+        # self._sidecar:Path | None = getSidecar(fileName)  # add "_sidecar" to __slots__ when enabled
         self._source: str = source
 
     def getTime(self):
         return self._dateTime
 
+    def getTimeParsed(self) -> datetime | None:
+        """
+        Returns the date and time of creation as an aware datetime, or None if the file is
+        dateless. The string is only parsed once, and kept for the following calls, as the
+        dated neighbours of dateless files are asked for it many times.
+        """
+        if self._dateTimeParsed is None and self._dateTime is not None:
+            self._dateTimeParsed = parseDateTime(self._dateTime)
+        return self._dateTimeParsed
+
 class PhotoFile(MediaFile):
+    # No new attributes, but without this the instances would get a dict anyway
+    __slots__ = ()
+
     def __init__(self, etTagsDict: Dict[str, str]):
         """
         Parameters:
@@ -853,43 +933,92 @@ class PhotoFile(MediaFile):
 # Creation date fixers
 ####
 
-def inferDateFromNeighbours(mediaFileList:List[PhotoFile], datelessFileIndex: int) -> str | None:
+def inferDateFromNeighbours(mediaFileList:List[PhotoFile], datelessFileIndex: int, datedIdxs: List[int] | None = None) -> str | None:
     # The list has to be ordered by filename, otherwise the times we infer might not be
     # very relevant
     # We start with a list of Photo objects, and the item without a date.
-    # Get the index of the item to date (or get it as paramenter?)
-    # Check the previous item in the list of instances, and the element following it
-    # If a date is found, add that date plus a minute, for example
-    # If first or last item is reached, stop searching in that direction
-    oneMinute = timedelta(minutes=1)
-    addTime:bool = True
-    datedObjectIdx:int = 0
-    i:int = 1
-    while datelessFileIndex >= i:
-        if mediaFileList[datelessFileIndex - i].getTime() is not None:
-            datedObjectIdx = datelessFileIndex - i
-            # convert time to dateTime to easily add one minute to it
-            break
-        i += 1
-
-    if datedObjectIdx == 0:
-        # No "previous" file had a date, start to look "forward"
-        i = 1
-        while datelessFileIndex + i < len(mediaFileList):
-            if mediaFileList[datelessFileIndex + i].getTime() is not None:
-                datedObjectIdx = datelessFileIndex + i
-                addTime = False
+    # Check the previous dated item in the list of instances, or the following one if
+    # there's none before it. If a date is found, add that date plus a minute per file
+    # between them (or substract it, if the dated item is after the dateless one)
+    # datedIdxs is the sorted list of indexes of the dated items. If it's passed, the
+    # neighbours are found with a binary search on it. Otherwise, walk the list from the
+    # dateless file until the nearest dated item. To infer all the dateless items of a list,
+    # use inferDatesFromNeighbours instead.
+    datedObjectIdx:int | None = None
+    if datedIdxs is None:
+        for idx in range(datelessFileIndex - 1, -1, -1):
+            if mediaFileList[idx]._dateTime is not None:
+                datedObjectIdx = idx
                 break
-            i += 1
-
-    if datedObjectIdx != 0:
-        if addTime:
-            newTime = datetime.strptime(mediaFileList[datedObjectIdx].getTime(), offsetAwareFormatParsing) + (oneMinute * i) # type: ignore # Complains about the possibility of dateTime being None
         else:
-            newTime = datetime.strptime(mediaFileList[datedObjectIdx].getTime(), offsetAwareFormatParsing) - (oneMinute * i)# type: ignore # Complains about the possibility of dateTime being None
-        return newTime.strftime(offsetAwareFormatStringing)
-    # else, Could not find a single dated item!
-    return None
+            # No "previous" file had a date, use the first one "forward"
+            for idx in range(datelessFileIndex + 1, len(mediaFileList)):
+                if mediaFileList[idx]._dateTime is not None:
+                    datedObjectIdx = idx
+                    break
+    else:
+        # Position where our dateless file would go in the list of dated ones: the dated
+        # item before it is right to the left of it, and the one after it is right there
+        pos:int = bisect_left(datedIdxs, datelessFileIndex)
+        if pos > 0:
+            datedObjectIdx = datedIdxs[pos - 1]
+        elif pos < len(datedIdxs):
+            # No "previous" file had a date, use the first one "forward"
+            datedObjectIdx = datedIdxs[pos]
+    if datedObjectIdx is None:
+        # Could not find a single dated item!
+        return None
+    # One minute per file between the dateless file and its dated neighbour, forward in
+    # time if the neighbour was before it, backwards if it was after it
+    minutesToAdd:int = datelessFileIndex - datedObjectIdx
+    newTime = mediaFileList[datedObjectIdx].getTimeParsed() + timedelta(minutes=minutesToAdd) # type: ignore # Complains about the possibility of dateTime being None
+    return formatDateTime(newTime)
+
+def inferDatesFromNeighbours(mediaFileList:List[PhotoFile]) -> List[str | None]:
+    """
+    Infers the dates of all the dateless items in a list at once, with the same rules as
+    inferDateFromNeighbours: the previous dated item is preferred, and the following one
+    is used if there's none before it, with a minute per file between them.
+
+    Args:
+        mediaFileList: the list of files, ordered by filename
+
+    Returns:
+        A list with the inferred date of each dateless item, in the same positions as in
+        mediaFileList. Dated items, or dateless ones if no item in the list has a date, get
+        None.
+    """
+    numberOfFiles:int = len(mediaFileList)
+    # Index of the closest dated item at or before each position, in a forward sweep
+    prevDatedIdx: List[int | None] = [None] * numberOfFiles
+    lastDatedIdx: int | None = None
+    for idx, mediaFile in enumerate(mediaFileList):
+        if mediaFile._dateTime is not None:
+            lastDatedIdx = idx
+        prevDatedIdx[idx] = lastDatedIdx
+    # Same for the closest dated item at or after each position, in a backwards sweep
+    nextDatedIdx: List[int | None] = [None] * numberOfFiles
+    lastDatedIdx = None
+    for idx in range(numberOfFiles - 1, -1, -1):
+        if mediaFileList[idx]._dateTime is not None:
+            lastDatedIdx = idx
+        nextDatedIdx[idx] = lastDatedIdx
+
+    inferredDates: List[str | None] = [None] * numberOfFiles
+    for idx, mediaFile in enumerate(mediaFileList):
+        if mediaFile._dateTime is not None:
+            continue
+        datedObjectIdx = prevDatedIdx[idx]
+        if datedObjectIdx is None:
+            datedObjectIdx = nextDatedIdx[idx]
+            if datedObjectIdx is None:
+                # Could not find a single dated item!
+                break
+        # getTimeParsed keeps the parsed date in the instance, so each dated neighbour is
+        # only parsed once, no matter how many dateless files it serves
+        newTime = mediaFileList[datedObjectIdx].getTimeParsed() + timedelta(minutes=idx - datedObjectIdx) # type: ignore # Complains about the possibility of dateTime being None
+        inferredDates[idx] = formatDateTime(newTime)
+    return inferredDates
 
 # Given a dateless file, print all the date tags the file has (from exiftool). This will include filesystem ones
 # Infer date from neighbours
@@ -24,7 +24,7 @@
 import sys
 from os import environ
 from argparse import ArgumentParser
-from json import load
+from orjson import loads
 from pathlib import Path
 from support.support import lvl, debugPrint
 from massRenamer.massRenamer import generateSortedJSON, massRenamer, showAllTags, fixDateless, metadataDict, doExifToolBatchProcessing
@@ -73,11 +73,11 @@ if args.fixDatelessInterActive:
         debugPrint(lvl.ERROR, "Couldn't find the JSON file with the file data")
     else:
         # JSON file exists, process it.
-        with open("data_file_sorted.json", "r") as readFile:
-            jsonData = load(readFile)
+        with open("data_file_sorted.json", "rb") as readFile:
+            jsonData = loads(readFile.read())
 
     # Get the entries that are marked as dateless from the JSON
-    datelessItems = [key for key in jsonData.keys() if jsonData[key]["dateless"] == True]
+    datelessItems = [key for key, value in jsonData.items() if value["dateless"]]
     fixDateless(jsonData, datelessItems, Path(args.photosDir), inferMethod="interactive")
     exit(0)
 
@@ -109,25 +109,32 @@ if args.photosDir:
         debugPrint(lvl.ERROR, "Couldn't find the JSON file with the file data")
     else:
         # JSON file exists, process it. Pass the dryRun flag
-        with open("data_file_sorted.json", "r") as readFile:
-            jsonData: OrderedDict[str, metadataDict] = load(readFile)
+        with open("data_file_sorted.json", "rb") as readFile:
+            jsonData: OrderedDict[str, metadataDict] = loads(readFile.read())
         # Start filtering the JSON, and pass a subset of all the entries
         # in the sorted JSON. Make sure the sets are exclusive!
-        # NOTE: fails checks because the dict comprehension returns a dict, not an ordered Dict, but it's close enough
-        # I have to do a generator for typing to work
-        screenshotsJson: OrderedDict[str, metadataDict] = {key: value for (key, value) in jsonData.items() if jsonData[key]['screenshot'] == True} # type: ignore we can't do orderedDict comprehension, so this wil always be flagged
+        # All three subsets are filled in a single pass over the JSON, keeping its order
+        # NOTE: fails checks because these are dicts, not ordered Dicts, but it's close enough
+        screenshotsJson: OrderedDict[str, metadataDict] = {} # type: ignore
+        noCameraJson: OrderedDict[str, metadataDict] = {} # type: ignore
+        cameraJson: OrderedDict[str, metadataDict] = {} # type: ignore
+        for key, value in jsonData.items():
+            if value['screenshot'] == True:
+                screenshotsJson[key] = value
+            elif value['hasManufacturer'] == False:
+                # Docs that are not screenshots and have no manufacturer data
+                noCameraJson[key] = value
+            elif value['hasManufacturer'] == True:
+                # The rest, documents that have manufacturer data (and are not screenshots)
+                cameraJson[key] = value
 
         if screenshotsJson:
 
             massRenamer(screenshotsJson, args.photosDir, args.dryRun, "iPhone Screenshots", "ScreenShots")
 
-        # Docs that are not screenshots and have no manufacturer data
-        noCameraJson: OrderedDict[str, metadataDict] = {key: value for (key, value) in jsonData.items() if jsonData[key]['hasManufacturer'] == False and jsonData[key]['screenshot'] == False} # type: ignore we can't do orderedDict comprehension, so this wil always be flagged
         if noCameraJson:
 
             massRenamer(noCameraJson, args.photosDir, args.dryRun, "WhatsApp", "WhatsApp")
-        # The rest, documents that have manufacturer data (and are not screenshots)
-        cameraJson: OrderedDict[str, metadataDict] = {key: value for (key, value) in jsonData.items() if jsonData[key]['hasManufacturer'] == True and jsonData[key]['screenshot'] == False} # type: ignore we can't do orderedDict comprehension, so this wil always be flagged
 
         massRenamer(cameraJson, args.photosDir, args.dryRun, "iPhone")
 
@@ -145,10 +152,10 @@ if args.photosDir:
 
 ############## SCRIPTS ################
 # Load etJSON.json
-from json import load
+from orjson import loads
 etData: List = []
-with open("etJSON.json", "r") as readFile:
-    etData = load(readFile)
+with open("etJSON.json", "rb") as readFile:
+    etData = loads(readFile.read())
 
 # Get all the tags captured - Only once
 all_keys = set().union(*(dict.keys() for dict in etData))
@@ -12,6 +12,19 @@ def test_PhotoFile_Creation():
     testInstance = PhotoFile(exifData)
     assert isinstance(testInstance, PhotoFile)
 
+def test_PhotoFile_hasNoInstanceDict():
+    exifData = {"sourceFile": "fakeFile.jpg", "EXIF:Make": "Apple", "EXIF:Model": "iPhone 8", "EXIF:CreateDate": "1234:12:12 11:22:33"}
+    testInstance = PhotoFile(exifData)
+    assert testInstance._fileName == Path("fakeFile.jpg")
+    with raises(AttributeError) as e_info:
+        testInstance.notAnAttribute = True
+
+def test_PhotoFile_getTimeParsed():
+    exifData = {"sourceFile": "fakeFile.jpg", "EXIF:Make": "Apple", "EXIF:Model": "iPhone 8", "EXIF:CreateDate": "1234:12:12 11:22:33"}
+    assert PhotoFile(exifData).getTimeParsed() == datetime(1234, 12, 12, 11, 22, 33, tzinfo=timezone.utc)
+    exifData = {"sourceFile": "fakeFile.jpg", "EXIF:Make": "Apple", "EXIF:Model": "iPhone 8"}
+    assert PhotoFile(exifData).getTimeParsed() is None
+
 """
 getTimeOffset()
 
@@ -47,12 +60,39 @@ def test_getTimeOffset_NoDateTags():
         getTimeOffset({"QuickTime:DateTimeOriginal": "11:33:55 01:02:03"}, "QuickTime:DateTimeOriginal") == "1234:12:23 01:02:03+00:00"
 
 
+"""
+parseDateTime()
+
+- Date with positive and negative offsets
+- Date with "Z" as offset, which is UTC
+"""
+
+def test_parseDateTime_withOffset():
+    assert parseDateTime("2013:12:03 12:01:02+05:00") == datetime(2013, 12, 3, 12, 1, 2, tzinfo=timezone(timedelta(hours=5)))
+    assert parseDateTime("2013:12:03 12:01:02-03:30") == datetime(2013, 12, 3, 12, 1, 2, tzinfo=timezone(-timedelta(hours=3, minutes=30)))
+
+def test_parseDateTime_ZuluOffset():
+    assert parseDateTime("2013:12:03 12:01:02Z").utcoffset() == timedelta(0)
+    assert parseDateTime("2013:12:03 12:01:02Z") == datetime(2013, 12, 3, 12, 1, 2, tzinfo=timezone.utc)
+
+"""
+formatDateTime()
+
+- Date with positive, negative and zero offsets, offset always has the semicolon
+"""
+
+def test_formatDateTime_offsets():
+    assert formatDateTime(datetime(2013, 12, 3, 12, 1, 2, tzinfo=timezone(timedelta(hours=5)))) == "2013:12:03 12:01:02+05:00"
+    assert formatDateTime(datetime(2013, 12, 3, 12, 1, 2, tzinfo=timezone(-timedelta(hours=3, minutes=30)))) == "2013:12:03 12:01:02-03:30"
+    assert formatDateTime(datetime(213, 1, 3, 2, 1, 2, tzinfo=timezone.utc)) == "0213:01:03 02:01:02+00:00"
+
 """
 findCreationTime()
 
 - Has a date tag and returns it in UTC format (no +/-XX)
 - Has many date tags, returns the oldest in UTC format
 - Has no date tags, returns None
+- Has empty "0000:00:00 00:00:00" date tags, they are ignored
 """
 
 def test_findCreationTime_hasOneTag():
@@ -64,6 +104,10 @@ def test_findCreationTime_hasManyTags():
     assert findCreationTime({"EXIF:DateTimeOriginal": "2013:12:03 12:01:02", "EXIF:CreateDate": "2014:12:12 12:45:32"}) ==  "2013:12:03 12:01:02+00:00"
     assert findCreationTime({"EXIF:DateTimeOriginal": "2013:12:03 12:01:02", "EXIF:CreateDate": "2013:12:03 13:01:00+01:00"}) ==  "2013:12:03 13:01:00+01:00"
 
+def test_findCreationTime_emptyDates():
+    assert findCreationTime({"EXIF:DateTimeOriginal": "0000:00:00 00:00:00", "EXIF:CreateDate": "2013:12:03 12:01:02"}) ==  "2013:12:03 12:01:02+00:00"
+    assert findCreationTime({"EXIF:DateTimeOriginal": "0000:00:00 00:00:00"}) == None
+
 def test_findCreationTime_preferDatesWithOffset():
     assert findCreationTime({"EXIF:DateTimeOriginal": "2013:12:03 12:01:02", "XMP:DateTimeOriginal": "2014:05:10 15:20:02", "EXIF:CreateDate": "2013:12:03 13:01:02+01:00"}) ==  "2013:12:03 13:01:02+01:00"
 
@@ -201,6 +245,8 @@ def test_getFileSource_WhatsApp():
 inferDateFromNeighbours
 
 - Get the date from the previous item
+- The previous dated item is the first one of the list
+- The indexes of the dated items are passed precomputed
 
 """
 
@@ -238,6 +284,21 @@ def test_inferDateFromNeighboursTest3(listPhotoOneDatelessPreviousTest3):
     listOfItems:List[PhotoFile] = listPhotoOneDatelessPreviousTest3
     assert inferDateFromNeighbours(listOfItems, 3) == "1234:12:12 11:32:33+00:00"
 
+def test_inferDateFromNeighbours_firstItemIsDated(listPhotoOneDatelessTest1):
+    listOfItems:List[PhotoFile] = listPhotoOneDatelessTest1
+    assert inferDateFromNeighbours(listOfItems[:2], 1) == "1234:12:12 11:23:33+00:00"
+
+def test_inferDateFromNeighbours_precomputedDatedIdxs(listPhotoOneDatelessPreviousTest3):
+    listOfItems:List[PhotoFile] = listPhotoOneDatelessPreviousTest3
+    assert inferDateFromNeighbours(listOfItems, 2, [0, 1, 4]) == "1234:12:12 11:31:33+00:00"
+    assert inferDateFromNeighbours(listOfItems, 3, [0, 1, 4]) == "1234:12:12 11:32:33+00:00"
+
+def test_inferDatesFromNeighbours(listPhotoOneDatelessPreviousTest3):
+    listOfItems:List[PhotoFile] = listPhotoOneDatelessPreviousTest3
+    assert inferDatesFromNeighbours(listOfItems) == [None, None, "1234:12:12 11:31:33+00:00", "1234:12:12 11:32:33+00:00", None]
+    assert inferDatesFromNeighbours(listOfItems[2:]) == ["1234:12:12 11:38:33+00:00", "1234:12:12 11:39:33+00:00", None]
+    assert inferDatesFromNeighbours(listOfItems[2:4]) == [None, None]
+
 @pytest.fixture
 def listPhotoOneDatelessPreviousTest4():
     photoList = [ {"sourceFile": "fakeFile1.jpg", "EXIF:Make": "Apple", "EXIF:Model": "iPhone 8"},
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import pytest
+from orjson import dumps, loads
+
+# massRenamer.py imports support with a relative import from above its package, so it has
+# to be imported through src
+sys.path.insert(0, str(Path(__file__).parents[2]))
+from src.massRenamer import massRenamer
+
+"""
+fixDateless, interactive
+
+- Saving and quitting (-1) writes the JSON with the picks so far and removes the checkpoint
+"""
+
+class fakeExifTool:
+    """Stands in for ExifTool, returning the date tags in dateTags for the files asked"""
+    dateTags = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute_json(self, *args):
+        return [{"SourceFile": arg, **self.dateTags[arg]} for arg in args if arg in self.dateTags]
+
+def metadata(date: str, time: str, dateless: bool) -> massRenamer.metadataDict:
+    return {"date": date, "time": time, "hasSidecar": False, "dateless": dateless, "screenshot": False, "hasManufacturer": True}
+
+def test_fixDateless_saveAndQuit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    photosDir = tmp_path / "photos"
+    photosDir.mkdir()
+    files = [str(photosDir / f"IMG_{idx}.jpg") for idx in range(1, 5)]
+    for file in files:
+        Path(file).touch()
+    jsonData = {files[0]: metadata("2020:01:01", "10:00:00", False),
+                files[1]: metadata("", "", True),
+                files[2]: metadata("", "", True),
+                files[3]: metadata("", "", True)}
+    monkeypatch.chdir(tmp_path)
+    # A pick for the first dateless file, left by a previous run
+    with open(massRenamer.checkpointFileName, "wb") as writeFile:
+        writeFile.write(dumps({files[1]: ["2020:01:01", "10:01:00"]}))
+    fakeExifTool.dateTags = {files[2]: {"File:FileModifyDate": "2020:01:01 10:02:00+00:00", "EXIF:SubSecTimeOriginal": 837}}
+    monkeypatch.setattr(massRenamer, "ExifTool", fakeExifTool)
+    # Pick the first date for the second dateless file, and save and quit on the third one
+    answers = iter(["1", "-1"])
+    monkeypatch.setattr("builtins.input", lambda: next(answers))
+
+    with pytest.raises(SystemExit):
+        massRenamer.fixDateless(jsonData, files[1:], photosDir, inferMethod="interactive")
+
+    assert not Path(massRenamer.checkpointFileName).exists()
+    with open(massRenamer.jsonFileName, "rb") as readFile:
+        savedData = loads(readFile.read())
+    assert (savedData[files[1]]["date"], savedData[files[1]]["time"], savedData[files[1]]["dateless"]) == ("2020:01:01", "10:01:00", False)
+    assert (savedData[files[2]]["date"], savedData[files[2]]["time"], savedData[files[2]]["dateless"]) == ("2020:01:01", "10:02:00+00:00", False)
+    assert savedData[files[3]]["dateless"] == True
@@ -1,4 +1,3 @@
-from pytest import MonkeyPatch
 from massRenamer.massRenamerClasses import getSidecar
 from pathlib import Path
 
@@ -10,38 +9,23 @@ getSidecar
 - File doesn't have a sidecar
 
 """
-def test_getSidecar_sidecarSameName():
-    monkeypatch = MonkeyPatch()
-    def mocked_is_file(self):
-        if self.name == "sidecarExists.aae":
-            return True
-        else:
-            return False
+def test_getSidecar_sidecarSameName(tmp_path: Path):
+    (tmp_path / "sidecarExists.jpg").touch()
+    (tmp_path / "sidecarExists.aae").touch()
 
-    monkeypatch.setattr(Path, "is_file", mocked_is_file)
+    testPathExists = tmp_path / "sidecarExists.jpg"
+    assert getSidecar(testPathExists) == tmp_path / "sidecarExists.aae"
 
-    testPathExists = Path("sidecarExists.jpg")
-    assert getSidecar(testPathExists) == Path("sidecarExists.aae")
+def test_getSidecar_sidecarWithOSuffix(tmp_path: Path):
+    (tmp_path / "sidecarExists.jpg").touch()
+    (tmp_path / "sidecarExistsO.aae").touch()
 
-def test_getSidecar_sidecarWithOSuffix():
-    monkeypatch = MonkeyPatch()
-    def mocked_is_file(self):
-        if self.name == "sidecarExistsO.aae":
-            return True
-        else:
-            return False
+    testPathExists = tmp_path / "sidecarExists.jpg"
+    assert getSidecar(testPathExists) == tmp_path / "sidecarExistsO.aae"
 
-    monkeypatch.setattr(Path, "is_file", mocked_is_file)
+def test_getSidecar_sidecarDoesntExist(tmp_path: Path):
+    (tmp_path / "sidecarDoesntExists.jpg").touch()
+    (tmp_path / "someOtherFile.aae").touch()
 
-    testPathExists = Path("sidecarExists.jpg")
-    assert getSidecar(testPathExists) == Path("sidecarExistsO.aae")
-
-def test_getSidecar_sidecarDoesntExist():
-    monkeypatch = MonkeyPatch()
-    def mocked_is_file(self):
-            return False
-
-    monkeypatch.setattr(Path, "is_file", mocked_is_file)
-
-    testPathExists = Path("sidecarDoesntExists.jpg")
+    testPathExists = tmp_path / "sidecarDoesntExists.jpg"
     assert getSidecar(testPathExists) == None